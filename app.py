@@ -4,7 +4,23 @@ Binance USDT-M 선물 트레이딩 계산기 웹 애플리케이션
 
 import streamlit as st
 import pandas as pd
-from trading_calculator import calculate_trading_results, TradingInputs
+from typing import Literal, Tuple
+from trading_calculator import calculate_trading_results, TradingInputs, TradingResults
+
+
+# 결과 표 고정 항목
+_HEADER_ITEMS = (
+    "손절 폭 (%) / 손절가 / 실제 손실 금액",
+    "적정 포지션 크기 (Notional) / 수량",
+    "실제 진입 레버리지",
+    "필요 Margin",
+    "실제 진입 Notional",
+    "실제 진입 수량",
+)
+_FOOTER_ITEMS = (
+    "구조적 문제 여부",
+    "종합 판정",
+)
 
 
 def format_currency(value: float) -> str:
@@ -22,15 +38,38 @@ def format_number(value: float, decimals: int = 2) -> str:
     return f"{value:,.{decimals}f}"
 
 
-def create_results_table(results, inputs: TradingInputs) -> pd.DataFrame:
+@st.cache_data(max_entries=128)
+def _cached_calc(
+    total_asset: float,
+    risk_ratio: float,
+    direction: Literal["LONG", "SHORT"],
+    entry_price: float,
+    stop_loss: float,
+    take_profits: Tuple[float, ...],
+    margin_usage_ratio: float
+) -> TradingResults:
+    """동일 입력에 대한 계산 결과 캐시"""
+    inputs = TradingInputs(
+        total_asset=total_asset,
+        risk_ratio=risk_ratio,
+        direction=direction,
+        entry_price=entry_price,
+        stop_loss=stop_loss,
+        take_profits=list(take_profits),
+        margin_usage_ratio=margin_usage_ratio
+    )
+    return calculate_trading_results(inputs)
+
+
+def create_results_table(results: TradingResults) -> pd.DataFrame:
     """결과 표 생성 (동적 익절가 처리)"""
+    tp_results = results.take_profit_results
+    
+    # 고정 항목 + 익절가별 항목 + 구조적 문제 여부/종합 판정 (가장 아래)
     items = [
-        "손절 폭 (%) / 손절가 / 실제 손실 금액",
-        "적정 포지션 크기 (Notional) / 수량",
-        "실제 진입 레버리지",
-        "필요 Margin",
-        "실제 진입 Notional",
-        "실제 진입 수량",
+        *_HEADER_ITEMS,
+        *[f"{tp_num}차 손익비 (R/R) / 순이익" for tp_num in range(1, len(tp_results) + 1)],
+        *_FOOTER_ITEMS,
     ]
     
     values = [
@@ -40,45 +79,63 @@ def create_results_table(results, inputs: TradingInputs) -> pd.DataFrame:
         format_currency(results.required_margin),
         format_currency(results.actual_entry_notional),
         format_number(results.actual_entry_quantity, 6),
-    ]
-    
-    # 동적 익절가 결과 추가
-    for tp_num in sorted(results.take_profit_results.keys()):
-        tp_result = results.take_profit_results[tp_num]
-        items.append(f"{tp_num}차 손익비 (R/R) / 순이익")
-        values.append(f"{tp_result['rr_ratio']:.2f} / {format_currency(tp_result['profit'])}")
-    
-    # 구조적 문제 여부와 종합 판정을 가장 아래에 추가
-    items.extend([
-        "구조적 문제 여부",
-        "종합 판정"
-    ])
-    
-    values.extend([
+        *[
+            f"{rr_ratio:.2f} / {format_currency(profit)}"
+            for rr_ratio, _, profit in tp_results.tolist()
+        ],
         results.structural_issue,
-        results.overall_judgment
-    ])
+        results.overall_judgment,
+    ]
     
     return pd.DataFrame({"항목": items, "값": values})
 
 
-def generate_alert_message(results, inputs: TradingInputs) -> str:
+@st.cache_data(max_entries=128)
+def _cached_results_table(
+    total_asset: float,
+    risk_ratio: float,
+    direction: Literal["LONG", "SHORT"],
+    entry_price: float,
+    stop_loss: float,
+    take_profits: Tuple[float, ...],
+    margin_usage_ratio: float
+) -> pd.DataFrame:
+    """동일 입력에 대한 결과 표 캐시 (_cached_calc 와 같은 키 사용)"""
+    results = _cached_calc(
+        total_asset,
+        risk_ratio,
+        direction,
+        entry_price,
+        stop_loss,
+        take_profits,
+        margin_usage_ratio
+    )
+    return create_results_table(results)
+
+
+@st.cache_data(max_entries=128)
+def generate_alert_message(
+    direction: Literal["LONG", "SHORT"],
+    entry_price: float,
+    stop_loss: float,
+    take_profits: Tuple[float, ...],
+    required_margin: float,
+    actual_entry_leverage: float
+) -> str:
     """Alert 메시지 생성 (동적 익절가 처리)"""
-    direction_symbol = "📈 LONG" if inputs.direction == "LONG" else "📉 SHORT"
+    direction_symbol = "📈 LONG" if direction == "LONG" else "📉 SHORT"
     
     # 익절가 동적 생성
-    tp_lines = []
-    for idx, tp in enumerate(inputs.take_profits, start=1):
-        tp_lines.append(f"• TP{idx} : {tp:.2f}")
-    
-    tp_section = "\n".join(tp_lines)
+    tp_section = "\n".join(
+        f"• TP{idx} : {tp:.2f}" for idx, tp in enumerate(take_profits, start=1)
+    )
     
     message = f"""{direction_symbol} SETUP
-• Entry : {inputs.entry_price:.2f}
-• Margin : {results.required_margin:.2f}
+• Entry : {entry_price:.2f}
+• Margin : {required_margin:.2f}
 {tp_section}
-• SL : {inputs.stop_loss:.2f}
-• Leverage : {results.actual_entry_leverage:.2f}x"""
+• SL : {stop_loss:.2f}
+• Leverage : {actual_entry_leverage:.2f}x"""
     
     return message
 
@@ -188,29 +245,37 @@ def main():
                 st.error("최소 1개의 익절가를 입력해주세요.")
                 return
             
-            inputs = TradingInputs(
-                total_asset=total_asset,
-                risk_ratio=risk_ratio,
-                direction=direction,
-                entry_price=entry_price,
-                stop_loss=stop_loss,
-                take_profits=take_profits,
-                margin_usage_ratio=margin_usage_ratio
+            # 캐시 키로 쓰이는 입력값 (hashable)
+            calc_args = (
+                total_asset,
+                risk_ratio,
+                direction,
+                entry_price,
+                stop_loss,
+                tuple(take_profits),
+                margin_usage_ratio
             )
             
             # 계산 수행
-            results = calculate_trading_results(inputs)
+            results = _cached_calc(*calc_args)
             
             # 결과 표시
             st.subheader("📋 계산 결과")
-            results_df = create_results_table(results, inputs)
+            results_df = _cached_results_table(*calc_args)
             st.dataframe(results_df, use_container_width=True, hide_index=True)
             
             st.markdown("---")
             
             # Alert 메시지
             st.subheader("🔔 Alert 메시지")
-            alert_message = generate_alert_message(results, inputs)
+            alert_message = generate_alert_message(
+                direction,
+                entry_price,
+                stop_loss,
+                tuple(take_profits),
+                results.required_margin,
+                results.actual_entry_leverage
+            )
             st.code(alert_message, language=None)
             
             # 복사 버튼
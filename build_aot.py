@@ -0,0 +1,70 @@
+"""
+트레이딩 계산 핵심부 AOT 컴파일 스크립트
+numba.pycc 로 _calc_core 를 trading_core 확장 모듈로 미리 컴파일하여
+Streamlit 첫 실행 시 JIT 컴파일 지연을 없앰
+
+사용법: python build_aot.py
+
+참고: numba.pycc 는 numba 0.68 기준 지원 중단 예정(NumbaPendingDeprecationWarning)
+"""
+
+import importlib.util
+import os
+import sys
+
+from numba.pycc import CC
+
+# 기존 trading_core 빌드가 임포트되지 않도록 막고 JIT 경로로 계산 모듈을 로드
+sys.modules["trading_core"] = None
+
+import check_parity
+import trading_calculator as tc
+
+
+OUTPUT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+cc = CC("trading_core")
+cc.output_dir = OUTPUT_DIR
+cc.export(
+    "calc_core",
+    "Tuple((f8[:], f8[:,:]))(f8,f8,f8,f8[:],f8,f8,f8)"
+)(tc._calc_core.py_func)
+
+
+@cc.export("abi_version", "i8()")
+def abi_version():
+    """빌드 시점의 CALC_CORE_ABI_VERSION (임포트 시 일치 여부 확인용)"""
+    return tc.CALC_CORE_ABI_VERSION
+
+
+@cc.export("source_fingerprint", "i8()")
+def source_fingerprint():
+    """빌드 시점의 trading_calculator.py 소스 해시 (임포트 시 일치 여부 확인용)"""
+    return tc.CALC_CORE_FINGERPRINT
+
+
+def verify_built_module() -> None:
+    """방금 빌드한 trading_core 를 파일에서 직접 로드하여 기준값과 비교"""
+    path = os.path.join(cc.output_dir, cc.output_file)
+    spec = importlib.util.spec_from_file_location("trading_core", path)
+    trading_core = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(trading_core)
+    
+    if trading_core.abi_version() != tc.CALC_CORE_ABI_VERSION:
+        raise AssertionError("trading_core ABI 버전 불일치")
+    if trading_core.source_fingerprint() != tc.CALC_CORE_FINGERPRINT:
+        raise AssertionError("trading_core 소스 해시 불일치")
+    
+    # check_parity 의 기준값 검증을 AOT 경로로 실행
+    jit_calc_core = tc.calc_core
+    tc.calc_core = trading_core.calc_core
+    try:
+        check_parity.check_reference_cases()
+    finally:
+        tc.calc_core = jit_calc_core
+
+
+if __name__ == "__main__":
+    cc.compile()
+    verify_built_module()
+    print("trading_core 컴파일 및 검증 완료")
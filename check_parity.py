@@ -0,0 +1,103 @@
+"""
+계산 결과 회귀 검증 스크립트
+방향 부호(sign) 기반 계산이 기존 LONG/SHORT 분기 구현과 같은 결과를 내는지 확인
+
+사용법: python check_parity.py
+"""
+
+import math
+import random
+
+import numpy as np
+
+import trading_calculator as tc
+
+
+# 기존 LONG/SHORT 분기 구현으로 계산한 기준값
+# (입력, [손절 폭, 실제 손실, Notional, 수량, 레버리지, 실질 레버리지, 필요 Margin],
+#  익절가별 [rr_ratio, actual_rr, profit], 구조적 문제, 종합 판정)
+REFERENCE_CASES = [
+    (
+        (10000.0, 5.0, "LONG", 50000.0, 49000.0, [51000.0, 52000.0], 60.0),
+        [2.0, 500.0, 24047.710657945365, 0.4809542131589073,
+         4.007951776324227, 2.4047710657945367, 6000.0],
+        [[1.0, 0.9230473258945749, 461.52366294728745],
+         [2.0, 1.8845709888418622, 942.2854944209312]],
+        "문제 없음",
+        "문제 없음",
+    ),
+    (
+        (10000.0, 5.0, "SHORT", 50000.0, 51000.0, [49000.0, 48000.0], 60.0),
+        [2.0, 499.99999999999994, 24029.219530949635, 0.48058439061899266,
+         4.004869921824939, 2.4029219530949635, 6000.0],
+        [[1.0, 0.9231064975009612, 461.5532487504805],
+         [2.0, 1.8846597462514418, 942.3298731257208]],
+        "문제 없음",
+        "문제 없음",
+    ),
+    (
+        (300.0, 20.0, "SHORT", 1.23, 1.2, [1.25, 1.3], 1.0),
+        [-2.4390243902439046, 60.00000000000001, -2542.37288135593,
+         -2066.9698222405937, 3.0, -8.474576271186434, -847.4576271186434],
+        [[0.0, 0.7231638418079096, 43.38983050847458],
+         [0.0, 2.4463276836158188, 146.77966101694915]],
+        "스탑로스가 진입가보다 낮거나 같음 / 1차 익절이 진입가보다 높거나 같음 / "
+        "1차 익절이 이전 익절가보다 높거나 같음 / 2차 익절이 진입가보다 높거나 같음 / "
+        "2차 익절이 이전 익절가보다 높거나 같음",
+        "SL 조정 필요",
+    ),
+]
+
+
+def check_reference_cases() -> None:
+    """기준값과 전체 계산 결과 비교"""
+    for args, expected_summary, expected_tps, expected_issue, expected_judgment in REFERENCE_CASES:
+        results = tc.calculate_trading_results(tc.TradingInputs(*args))
+        summary = [
+            results.stop_loss_pct,
+            results.actual_loss_amount,
+            results.position_notional,
+            results.position_quantity,
+            results.position_leverage,
+            results.effective_leverage,
+            results.required_margin,
+        ]
+        if not np.allclose(summary, expected_summary, rtol=1e-12):
+            raise AssertionError(f"{args}: 요약 불일치 {summary} != {expected_summary}")
+        if not np.allclose(results.take_profit_results, expected_tps, rtol=1e-12):
+            raise AssertionError(f"{args}: 익절가 결과 불일치 {results.take_profit_results}")
+        if results.structural_issue != expected_issue:
+            raise AssertionError(f"{args}: 구조적 문제 불일치 {results.structural_issue}")
+        if results.overall_judgment != expected_judgment:
+            raise AssertionError(f"{args}: 종합 판정 불일치 {results.overall_judgment}")
+
+
+def check_sign_helpers(num_cases: int = 1000) -> None:
+    """부호 기반 헬퍼와 기존 분기 수식 비교 (무작위 입력)"""
+    rng = random.Random(0)
+    for _ in range(num_cases):
+        direction = rng.choice(["LONG", "SHORT"])
+        sign = tc.DIRECTION_LONG if direction == "LONG" else tc.DIRECTION_SHORT
+        entry_price = rng.choice([50000.0, 1.23, 100.0])
+        stop_loss = entry_price * rng.uniform(0.8, 1.2)
+        risk_amount = rng.uniform(1.0, 2000.0)
+
+        if direction == "LONG":
+            price_diff = entry_price - stop_loss
+        else:  # SHORT
+            price_diff = stop_loss - entry_price
+
+        stop_loss_pct, _ = tc.calculate_stop_loss(sign, entry_price, stop_loss)
+        if not math.isclose(stop_loss_pct, (price_diff / entry_price) * 100, rel_tol=1e-12):
+            raise AssertionError(f"손절 폭 불일치: {direction} {entry_price} {stop_loss}")
+
+        _, quantity = tc.calculate_position_size(sign, entry_price, stop_loss, risk_amount)
+        fee_per_unit = (entry_price + stop_loss) * tc.TAKER_FEE_RATE
+        if not math.isclose(quantity, risk_amount / (price_diff + fee_per_unit), rel_tol=1e-12):
+            raise AssertionError(f"수량 불일치: {direction} {entry_price} {stop_loss}")
+
+
+if __name__ == "__main__":
+    check_reference_cases()
+    check_sign_helpers()
+    print("계산 결과 검증 완료")
@@ -4,9 +4,13 @@ Isolated Margin, Taker 수수료 포함
 함수형 프로그래밍 방식
 """
 
-from typing import Tuple, Literal, List, Dict
+import hashlib
+from typing import Tuple, Literal, List
 from dataclasses import dataclass, field
 
+import numpy as np
+from numba import njit
+
 
 # 상수 정의
 TAKER_FEE_RATE = 0.0004  # Taker 수수료 0.04% (왕복)
@@ -14,8 +18,16 @@ MIN_LEVERAGE = 3
 MAX_LEVERAGE = 150
 PREFERRED_LEVERAGE_RANGE = (3, 150)
 
+# 포지션 방향 부호 (LONG: +1, SHORT: -1) - 가격 차이 계산을 분기 없이 처리
+DIRECTION_LONG = 1.0
+DIRECTION_SHORT = -1.0
+
+# trading_core 확장 모듈(build_aot.py)의 ABI 버전
+# _calc_core 의 인자/반환 형식이 바뀌면 올릴 것 (소스 변경 자체는 CALC_CORE_FINGERPRINT 로 감지)
+CALC_CORE_ABI_VERSION = 1
+
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TradingInputs:
     """트레이딩 입력 파라미터"""
     total_asset: float  # 총 자산 (USD)
@@ -27,7 +39,7 @@ class TradingInputs:
     margin_usage_ratio: float = 60.0  # 사용 가능 Margin 비율 (%) - 총 자산 대비 % (기본값 60%)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TradingResults:
     """계산 결과"""
     # 1. 손절 정보
@@ -43,8 +55,8 @@ class TradingResults:
     position_leverage: float  # 포지션 사용 레버리지
     effective_leverage: float  # 실질 레버리지
     
-    # 4. 손익비 및 수익 (딕셔너리로 동적 저장)
-    take_profit_results: Dict[int, Dict[str, float]]  # {차수: {rr_ratio, actual_rr, profit}}
+    # 4. 손익비 및 수익 (익절가 순서대로 한 행씩)
+    take_profit_results: np.ndarray = field(compare=False)  # shape (익절가 개수, 3): [rr_ratio, actual_rr, profit]
     
     # 5. 구조적 문제
     structural_issue: str  # 구조적 문제 여부
@@ -61,39 +73,35 @@ class TradingResults:
     actual_entry_leverage: float  # 실제 진입 레버리지
 
 
+@njit(cache=True)
 def calculate_risk_amount(total_asset: float, risk_ratio: float) -> float:
     """리스크 금액 계산"""
     return total_asset * (risk_ratio / 100)
 
 
+@njit(cache=True)
 def calculate_stop_loss(
-    direction: Literal["LONG", "SHORT"],
+    sign: float,
     entry_price: float,
     stop_loss: float
 ) -> Tuple[float, float]:
     """손절 정보 계산"""
-    if direction == "LONG":
-        stop_loss_pct = ((entry_price - stop_loss) / entry_price) * 100
-        stop_loss_price = stop_loss
-    else:  # SHORT
-        stop_loss_pct = ((stop_loss - entry_price) / entry_price) * 100
-        stop_loss_price = stop_loss
+    stop_loss_pct = ((sign * (entry_price - stop_loss)) / entry_price) * 100
+    stop_loss_price = stop_loss
     
     return stop_loss_pct, stop_loss_price
 
 
+@njit(cache=True)
 def calculate_position_size(
-    direction: Literal["LONG", "SHORT"],
+    sign: float,
     entry_price: float,
     stop_loss: float,
     risk_amount: float
 ) -> Tuple[float, float]:
     """포지션 사이즈 계산 (리스크 기반)"""
     # 손절 시 가격 차이
-    if direction == "LONG":
-        price_diff = entry_price - stop_loss
-    else:  # SHORT
-        price_diff = stop_loss - entry_price
+    price_diff = sign * (entry_price - stop_loss)
     
     # 리스크 금액 = price_diff * quantity + (entry + sl) * quantity * TAKER_FEE_RATE
     # quantity = risk_amount / (price_diff + (entry + sl) * TAKER_FEE_RATE)
@@ -106,30 +114,18 @@ def calculate_position_size(
     return notional, quantity
 
 
+@njit(cache=True)
 def calculate_actual_loss(
-    direction: Literal["LONG", "SHORT"],
-    entry_price: float,
-    stop_loss: float,
-    notional: float,
-    quantity: float
+    price_loss: float,
+    entry_fee: float,
+    sl_exit_fee: float
 ) -> float:
     """실제 손실 금액 계산 (수수료 포함)"""
-    # 손절 시 가격 차이로 인한 손실
-    if direction == "LONG":
-        price_loss = (entry_price - stop_loss) * quantity
-    else:  # SHORT
-        price_loss = (stop_loss - entry_price) * quantity
-    
-    # 수수료 (진입 + 손절)
-    entry_fee = notional * TAKER_FEE_RATE
-    exit_fee = stop_loss * quantity * TAKER_FEE_RATE
-    
-    # 실제 손실 = 가격 손실 + 수수료
-    actual_loss = price_loss + entry_fee + exit_fee
-    
-    return actual_loss
+    # 실제 손실 = 가격 손실 + 수수료 (진입 + 손절)
+    return price_loss + entry_fee + sl_exit_fee
 
 
+@njit(cache=True)
 def calculate_leverage(
     position_notional: float,
     risk_amount: float,
@@ -157,58 +153,132 @@ def calculate_leverage(
     return leverage, effective_leverage, required_margin
 
 
+@njit(cache=True)
 def calculate_rr_and_profit(
-    direction: Literal["LONG", "SHORT"],
+    sign: float,
     entry_price: float,
-    stop_loss: float,
-    take_profits: List[float],
-    notional: float,
+    take_profits: np.ndarray,
     quantity: float,
-    stop_loss_pct: float
-) -> Dict[int, Dict[str, float]]:
-    """손익비 및 수익 계산 (동적 익절가 처리)"""
-    # 실제 손실 (수수료 포함) - 모든 익절가에 공통
+    stop_loss_pct: float,
+    entry_fee: float,
+    actual_loss_with_fee: float
+) -> np.ndarray:
+    """손익비 및 수익 계산 (동적 익절가 처리)
+    
+    반환: shape (익절가 개수, 3) 배열, 열 = [이론 손익비, 실제 손익비, 순이익]
+    """
+    # 이익 퍼센트 및 이론적 손익비 (모든 익절가를 한 번에 벡터 연산으로 계산)
+    profit_pct = sign * (take_profits - entry_price) / entry_price * 100
+    if stop_loss_pct > 0:
+        rr_ratio = profit_pct / stop_loss_pct
+    else:
+        rr_ratio = np.zeros_like(profit_pct)
+    
+    # 실제 수익 (수수료 차감)
+    gross_profit = sign * (take_profits - entry_price) * quantity
+    tp_exit_fee = take_profits * quantity * TAKER_FEE_RATE
+    net_profit = gross_profit - entry_fee - tp_exit_fee
+    
+    if actual_loss_with_fee > 0:
+        actual_rr = net_profit / actual_loss_with_fee
+    else:
+        actual_rr = np.zeros_like(net_profit)
+    
+    results = np.empty((take_profits.shape[0], 3))
+    results[:, 0] = rr_ratio
+    results[:, 1] = actual_rr
+    results[:, 2] = net_profit
+    
+    return results
+
+
+# _calc_core JIT 시그니처 (AOT 모듈이 없을 때 임포트 시점에 미리 컴파일)
+_CALC_CORE_SIGNATURE = "Tuple((f8[::1], f8[:, ::1]))(f8, f8, f8, f8[::1], f8, f8, f8)"
+
+
+# fastmath 플래그는 호출되는 헬퍼에도 적용되므로, 비교 연산(손익비/레버리지 분기)에
+# 영향을 주는 nnan/ninf 를 제외하고 FMA 결합(contract)과 재결합(reassoc)만 허용
+@njit(cache=True, fastmath={"contract", "reassoc"})
+def _calc_core(
+    sign: float,
+    entry_price: float,
+    stop_loss: float,
+    take_profits: np.ndarray,
+    total_asset: float,
+    risk_ratio: float,
+    margin_usage_ratio: float
+) -> Tuple[np.ndarray, np.ndarray]:
+    """수치 계산 핵심부 (nopython 모드)
+    
+    반환: (요약 배열, 익절가별 결과 배열)
+    요약 배열 = [손절 폭, 손절가, 실제 손실, Notional, 수량,
+                 레버리지, 실질 레버리지, 필요 Margin]
+    """
+    risk_amount = calculate_risk_amount(total_asset, risk_ratio)
+    
+    stop_loss_pct, stop_loss_price = calculate_stop_loss(
+        sign, entry_price, stop_loss
+    )
+    
+    notional, quantity = calculate_position_size(
+        sign, entry_price, stop_loss, risk_amount
+    )
+    
+    # 손절 시 손실 및 수수료 - 실제 손실과 익절가별 손익비 계산에 공통
+    price_loss = sign * (entry_price - stop_loss) * quantity
     entry_fee = notional * TAKER_FEE_RATE
     sl_exit_fee = stop_loss * quantity * TAKER_FEE_RATE
+    actual_loss = calculate_actual_loss(price_loss, entry_fee, sl_exit_fee)
     
-    if direction == "LONG":
-        price_loss = (entry_price - stop_loss) * quantity
-    else:  # SHORT
-        price_loss = (stop_loss - entry_price) * quantity
-    
-    actual_loss_with_fee = price_loss + entry_fee + sl_exit_fee
-    
-    # 각 익절가별 계산
-    results = {}
-    
-    for idx, take_profit in enumerate(take_profits, start=1):
-        # 이익 퍼센트 계산
-        if direction == "LONG":
-            profit_pct = ((take_profit - entry_price) / entry_price) * 100
-        else:  # SHORT
-            profit_pct = ((entry_price - take_profit) / entry_price) * 100
-        
-        # 이론적 손익비
-        rr_ratio = profit_pct / stop_loss_pct if stop_loss_pct > 0 else 0
-        
-        # 실제 수익 (수수료 차감)
-        if direction == "LONG":
-            gross_profit = (take_profit - entry_price) * quantity
-        else:  # SHORT
-            gross_profit = (entry_price - take_profit) * quantity
-        
-        tp_exit_fee = take_profit * quantity * TAKER_FEE_RATE
-        net_profit = gross_profit - entry_fee - tp_exit_fee
-        
-        actual_rr = net_profit / actual_loss_with_fee if actual_loss_with_fee > 0 else 0
-        
-        results[idx] = {
-            "rr_ratio": rr_ratio,
-            "actual_rr": actual_rr,
-            "profit": net_profit
-        }
+    leverage, effective_leverage, required_margin = calculate_leverage(
+        notional, risk_amount, total_asset, margin_usage_ratio
+    )
     
-    return results
+    take_profit_results = calculate_rr_and_profit(
+        sign,
+        entry_price,
+        take_profits,
+        quantity,
+        stop_loss_pct,
+        entry_fee,
+        actual_loss
+    )
+    
+    summary = np.array([
+        stop_loss_pct,
+        stop_loss_price,
+        actual_loss,
+        notional,
+        quantity,
+        leverage,
+        effective_leverage,
+        required_margin,
+    ])
+    
+    return summary, take_profit_results
+
+
+def _source_fingerprint() -> int:
+    """이 모듈 소스의 해시 (int64 범위) - 상수/수식이 컴파일된 trading_core 와 비교용"""
+    with open(__file__, "rb") as f:
+        return int(hashlib.sha256(f.read()).hexdigest()[:15], 16)
+
+
+CALC_CORE_FINGERPRINT = _source_fingerprint()
+
+try:
+    # build_aot.py 로 미리 컴파일된 확장 모듈 (JIT 컴파일 지연 없음)
+    from trading_core import abi_version, calc_core, source_fingerprint
+    if (
+        abi_version() != CALC_CORE_ABI_VERSION
+        or source_fingerprint() != CALC_CORE_FINGERPRINT
+    ):
+        # 현재 소스와 다른 계산 로직/상수로 빌드된 모듈 - 결과나 인자 형식이 다를 수 있음
+        raise ImportError("trading_core 가 현재 trading_calculator.py 와 다른 소스로 빌드됨")
+except ImportError:
+    calc_core = _calc_core
+    # 명시적 시그니처로 미리 컴파일하여 첫 계산 클릭 시 타입 추론/컴파일 지연 제거
+    calc_core.compile(_CALC_CORE_SIGNATURE)
 
 
 def check_structural_issues(
@@ -221,29 +291,29 @@ def check_structural_issues(
     issues = []
     
     if direction == "LONG":
-        if stop_loss >= entry_price:
-            issues.append("스탑로스가 진입가보다 높거나 같음")
-        
-        # 각 익절가 검증
-        prev_tp = entry_price
-        for idx, take_profit in enumerate(take_profits, start=1):
-            if take_profit <= entry_price:
-                issues.append(f"{idx}차 익절이 진입가보다 낮거나 같음")
-            if take_profit <= prev_tp:
-                issues.append(f"{idx}차 익절이 이전 익절가보다 낮거나 같음")
-            prev_tp = take_profit
+        sign = DIRECTION_LONG
+        sl_msg = "스탑로스가 진입가보다 높거나 같음"
+        wrong_side = "낮거나 같음"
     else:  # SHORT
-        if stop_loss <= entry_price:
-            issues.append("스탑로스가 진입가보다 낮거나 같음")
-        
-        # 각 익절가 검증
-        prev_tp = entry_price
-        for idx, take_profit in enumerate(take_profits, start=1):
-            if take_profit >= entry_price:
-                issues.append(f"{idx}차 익절이 진입가보다 높거나 같음")
-            if take_profit >= prev_tp:
-                issues.append(f"{idx}차 익절이 이전 익절가보다 높거나 같음")
-            prev_tp = take_profit
+        sign = DIRECTION_SHORT
+        sl_msg = "스탑로스가 진입가보다 낮거나 같음"
+        wrong_side = "높거나 같음"
+    
+    if sign * (entry_price - stop_loss) <= 0:
+        issues.append(sl_msg)
+    
+    # 각 익절가 검증 (진입가 대비 방향, 이전 익절가 대비 단조성)
+    tp = np.asarray(take_profits, dtype=np.float64)
+    seq = np.concatenate((np.array([entry_price]), tp))
+    bad_side = sign * (tp - entry_price) <= 0
+    bad_mono = sign * np.diff(seq) <= 0
+    
+    for i in np.flatnonzero(bad_side | bad_mono).tolist():
+        idx = i + 1
+        if bad_side[i]:
+            issues.append(f"{idx}차 익절이 진입가보다 {wrong_side}")
+        if bad_mono[i]:
+            issues.append(f"{idx}차 익절이 이전 익절가보다 {wrong_side}")
     
     if not issues:
         return "문제 없음"
@@ -277,51 +347,28 @@ def judge_overall(
 
 def calculate_trading_results(inputs: TradingInputs) -> TradingResults:
     """모든 계산 수행 (메인 함수)"""
-    # 리스크 금액 계산
-    risk_amount = calculate_risk_amount(inputs.total_asset, inputs.risk_ratio)
+    dir_sign = DIRECTION_LONG if inputs.direction == "LONG" else DIRECTION_SHORT
     
-    # 1. 손절 정보 계산
-    stop_loss_pct, stop_loss_price = calculate_stop_loss(
-        inputs.direction,
-        inputs.entry_price,
-        inputs.stop_loss
-    )
-    
-    # 2. 포지션 사이즈 계산 (리스크 기반)
-    position_notional, position_quantity = calculate_position_size(
-        inputs.direction,
-        inputs.entry_price,
-        inputs.stop_loss,
-        risk_amount
-    )
-    
-    # 실제 손실 금액 계산 (수수료 포함)
-    actual_loss = calculate_actual_loss(
-        inputs.direction,
+    # 1~4. 손절 정보, 포지션 사이즈, 레버리지, 손익비 및 수익 계산
+    summary, take_profit_results = calc_core(
+        dir_sign,
         inputs.entry_price,
         inputs.stop_loss,
-        position_notional,
-        position_quantity
-    )
-    
-    # 3. 레버리지 계산
-    position_leverage, effective_leverage, required_margin = calculate_leverage(
-        position_notional,
-        risk_amount,
+        np.asarray(inputs.take_profits, dtype=np.float64),
         inputs.total_asset,
+        inputs.risk_ratio,
         inputs.margin_usage_ratio
     )
-    
-    # 4. 손익비 및 수익 계산
-    take_profit_results = calculate_rr_and_profit(
-        inputs.direction,
-        inputs.entry_price,
-        inputs.stop_loss,
-        inputs.take_profits,
+    (
+        stop_loss_pct,
+        stop_loss_price,
+        actual_loss,
         position_notional,
         position_quantity,
-        stop_loss_pct
-    )
+        position_leverage,
+        effective_leverage,
+        required_margin,
+    ) = summary.tolist()
     
     # 5. 구조적 문제 확인
     structural_issue = check_structural_issues(